@@ -25,6 +25,17 @@ class RequesterReplaceViewTextCommand(sublime_plugin.TextCommand):
             self.view.sel().add(sublime.Region(point))
 
 
+class RequesterAppendViewTextCommand(sublime_plugin.TextCommand):
+    """`TextCommand` to append `text` to end of view, without selecting text
+    after. Optionally leave cursor at `point`.
+    """
+    def run(self, edit, text, point=None):
+        self.view.insert(edit, self.view.size(), text)
+        if point is not None:
+            self.view.sel().clear()
+            self.view.sel().add(sublime.Region(point))
+
+
 class RequesterCloseResponseTabsCommand(sublime_plugin.WindowCommand):
     """Iterate over all open tabs and close response tabs.
     """
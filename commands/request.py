@@ -16,10 +16,76 @@ from ..core.parsers import parse_requests
 from ..core.responses import prepare_request
 from ..core.helpers import clean_url, truncate
 
+try:  # not vendored under `deps` because it's a compiled extension, but use it if it's importable
+    import orjson
+except ImportError:
+    orjson = None
 
-Content = namedtuple('Content', 'content, point')
+
+Content = namedtuple('Content', 'header, body, point')
 platform = sublime.platform()
 
+response_view_index = {}  # (method, url) and ('tabname', tabname) keys -> {view_id: view}
+response_view_keys = {}  # view_id -> keys under which view is indexed
+response_view_index_built = False
+
+last_activity_shown = {}  # view_id -> (name, text) shown by last activity tick
+
+
+def index_response_view(view, method, url, tabname=None):
+    """Index response view under its request's method and URL, and under its
+    tabname if it has one, so that views matching a request can be found without
+    scanning every sheet in the window.
+    """
+    view_id = view.id()
+    remove_response_view_from_index(view_id)
+    keys = [(method, clean_url(url))]
+    if tabname:
+        keys.append(('tabname', tabname))
+    for key in keys:
+        response_view_index.setdefault(key, {})[view_id] = view
+    response_view_keys[view_id] = keys
+
+
+def remove_response_view_from_index(view_id):
+    """Evict view from all keys under which it's indexed.
+    """
+    for key in response_view_keys.pop(view_id, ()):
+        views = response_view_index.get(key)
+        if views:
+            views.pop(view_id, None)
+            if not views:
+                del response_view_index[key]
+
+
+def build_response_view_index():
+    """Index response views that were already open when the plugin loaded.
+    """
+    global response_view_index_built
+    response_view_index_built = True
+    for window in sublime.windows():
+        for sheet in window.sheets():
+            view = sheet.view()
+            if not view:
+                continue
+            settings = view.settings()
+            if not settings.get('requester.response_view', False):
+                continue
+            method = settings.get('requester.request_method', None)
+            url = settings.get('requester.request_url', None)
+            if not method or not url:
+                continue
+            index_response_view(view, method, url, settings.get('requester.tabname', None))
+
+
+class RequesterResponseViewIndexListener(sublime_plugin.EventListener):
+    """Evict closed response views from the response view index.
+    """
+    def on_close(self, view):
+        view_id = view.id()
+        remove_response_view_from_index(view_id)
+        last_activity_shown.pop(view_id, None)
+
 
 def response_tab_bindings(include_delete=False):
     """Returns string with special key bindings for response tab commands.
@@ -67,6 +133,22 @@ def get_content(res, fmt):
     if res.encoding == 'ISO-8859-1':  # see this old issue: https://github.com/kennethreitz/requests/issues/1604
         res.encoding = res.apparent_encoding
 
+    if fmt not in ('indent', 'indent_sort'):  # don't parse JSON that won't be prettified
+        return res.text
+    content_type = res.headers.get('content-type', '')
+    if content_type and 'json' not in content_type.lower():  # don't probe responses that don't claim to be JSON
+        return res.text
+
+    if orjson is not None:  # SIMD-accelerated parse and C serializer, much faster on big responses
+        # caveat: orjson parses ints outside the 64-bit range to lossy floats, so huge ints
+        # are displayed inexactly here, while the stdlib path below displays them exactly
+        try:
+            json_dict = orjson.loads(res.content)
+            option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if fmt == 'indent_sort' else 0)
+            return orjson.dumps(json_dict, option=option).decode('utf-8')
+        except Exception:
+            pass  # e.g. dumps hits its recursion limit on deeply nested JSON; stdlib handles it below
+
     try:
         json_dict = res.json()
     except:
@@ -76,14 +158,14 @@ def get_content(res, fmt):
         # ensures non-ascii chars aren't escaped; if all text is in unicode using ensure_ascii=False is safe
         if fmt == 'indent_sort':
             return json.dumps(json_dict, sort_keys=True, indent=2, separators=(',', ': '), ensure_ascii=False)
-        if fmt == 'indent':
-            return json.dumps(json_dict, indent=2, separators=(',', ': '), ensure_ascii=False)
-        return res.text
+        return json.dumps(json_dict, indent=2, separators=(',', ': '), ensure_ascii=False)
 
 
 def get_response_view_content(response):
-    """Returns a response string that includes metadata, headers and content,
-    and the index of the string at which response content begins.
+    """Returns a header string with metadata and headers, the response content
+    string, and the index at which response content begins. Header and content
+    are kept separate so views can be populated without concatenating them into
+    one giant string; for multi-MB responses that copy doubles peak memory.
     """
     req, res, err = response
 
@@ -134,7 +216,7 @@ def get_response_view_content(response):
         before_content_items.insert(3, 'Request Body: {}'.format(truncate(body, 1000)))
     before_content = '\n\n'.join(before_content_items)
 
-    return Content(before_content + '\n\n' + content, len(before_content) + 2)
+    return Content(before_content + '\n\n', content, len(before_content) + 2)
 
 
 def set_response_view_name(view, response=None):
@@ -143,13 +225,15 @@ def set_response_view_name(view, response=None):
     config = sublime.load_settings('Requester.sublime-settings')
     max_len = int(config.get('response_tab_name_length', 32))
 
+    settings = view.settings()
+
     def helper(name):
-        view.settings().set('requester.name', name)
-        pinned = view.settings().get('requester.response_pinned', False)
+        settings.set('requester.name', name)
+        pinned = settings.get('requester.response_pinned', False)
         view.set_name('{}{}'.format('** ' if pinned else '', truncate(name, max_len)))
 
     if response is None:
-        return helper(view.settings().get('requester.name'))
+        return helper(settings.get('requester.name'))
     req, res, err = response
     if req.skwargs.get('tabname'):
         return helper(req.skwargs.get('tabname'))
@@ -215,24 +299,33 @@ class RequestsMixin:
         """If there are already open response views waiting to display content from
         pending requests, show activity indicators in views.
         """
+        updated = set()
         for req in requests:
             for view in self.response_views_with_matching_request(
                 req.method, req.url, req.skwargs.get('tabname')
             ):
-                # view names set BEFORE view content is set, otherwise
-                # activity indicator in view names seems to lag a little
+                view_id = view.id()
+                if view_id in updated:  # views matching more than one pending request get one update per tick
+                    break
+                updated.add(view_id)
+
                 name = view.settings().get('requester.name')
                 if not name:
-                    view.set_name(activity)
+                    view_name = activity
                 else:
                     spaces = min(self.ACTIVITY_SPACES, len(name))
-                    activity = self.get_activity_indicator(count, spaces)
                     extra_spaces = 4  # extra spaces because tab names don't use monospace font =/
-                    view.set_name(activity.ljust(len(name) + extra_spaces))
+                    view_name = self.get_activity_indicator(count, spaces).ljust(len(name) + extra_spaces)
+                text = '{}\n\n{}\n'.format(req.request, activity)
+
+                if last_activity_shown.get(view_id) == (view_name, text):
+                    break  # don't dispatch commands if nothing changed since last tick
+                last_activity_shown[view_id] = (view_name, text)
 
-                view.run_command('requester_replace_view_text', {'text': '{}\n\n{}\n'.format(
-                    req.request, activity
-                )})
+                # view names set BEFORE view content is set, otherwise
+                # activity indicator in view names seems to lag a little
+                view.set_name(view_name)
+                view.run_command('requester_replace_view_text', {'text': text})
                 break  # do this for first view only
 
     def response_views_with_matching_request(self, method, url, tabname=None):
@@ -241,26 +334,25 @@ class RequestsMixin:
         if self.view.settings().get('requester.response_view', False):
             return [self.view]  # don't update other views when replaying a request
 
+        if not response_view_index_built:
+            build_response_view_index()
+
+        if tabname:
+            candidates = response_view_index.get(('tabname', tabname), {})
+        else:
+            candidates = response_view_index.get((method, clean_url(url)), {})
+
+        window = self.view.window()
         views = []
-        for sheet in self.view.window().sheets():
-            view = sheet.view()
-            if not view:
+        for view in list(candidates.values()):
+            if not view.is_valid():  # defense against views closed without `on_close` firing
+                remove_response_view_from_index(view.id())
+                continue
+            if view.window() != window:
                 continue
             if view.settings().get('requester.response_pinned', False):
                 continue
-
-            if view.settings().get('requester.response_view', False):
-                if tabname:
-                    if view.settings().get('requester.tabname') == tabname:
-                        views.append(view)
-                    continue
-
-                view_method = view.settings().get('requester.request_method', None)
-                view_url = view.settings().get('requester.request_url', None)
-                if not view_method or not view_url:
-                    continue
-                if method == view_method and clean_url(url) == clean_url(view_url):
-                    views.append(view)
+            views.append(view)
         return views
 
     def handle_response(self, response):
@@ -306,8 +398,9 @@ class RequestsMixin:
         view.settings().set('requester.response_view', True)
         self.set_env_on_view(view)
 
-        content, point = get_response_view_content(response)
-        view.run_command('requester_replace_view_text', {'text': content, 'point': point})
+        content = get_response_view_content(response)
+        view.run_command('requester_replace_view_text', {'text': content.header})
+        view.run_command('requester_append_view_text', {'text': content.body, 'point': content.point})
         view.set_syntax_file('Packages/Requester/syntax/requester-response.sublime-syntax')
         set_request_on_view(view, response)
 
@@ -377,9 +470,10 @@ class RequesterReplayRequestCommand(RequestsMixin, RequestCommandMixin, sublime_
         if err:
             return
 
-        content, point = get_response_view_content(response)
+        content = get_response_view_content(response)
 
-        view.run_command('requester_replace_view_text', {'text': content, 'point': point})
+        view.run_command('requester_replace_view_text', {'text': content.header})
+        view.run_command('requester_append_view_text', {'text': content.body, 'point': content.point})
         view.set_syntax_file('Packages/Requester/syntax/requester-response.sublime-syntax')
         set_request_on_view(view, response)
         view.settings().erase('requester.request_history_index')
@@ -436,8 +530,9 @@ class RequesterExploreUrlCommand(RequesterReplayRequestCommand):
         view.settings().set('requester.response_view', True)
         view.set_scratch(True)
 
-        content, point = get_response_view_content(response)
-        view.run_command('requester_replace_view_text', {'text': content, 'point': point})
+        content = get_response_view_content(response)
+        view.run_command('requester_replace_view_text', {'text': content.header})
+        view.run_command('requester_append_view_text', {'text': content.body, 'point': content.point})
         view.set_syntax_file('Packages/Requester/syntax/requester-response.sublime-syntax')
         set_request_on_view(view, response)
         set_response_view_name(view, response)
@@ -486,8 +581,11 @@ class RequesterCancelRequestsCommand(sublime_plugin.WindowCommand):
     """
     def run(self):
         pools = RequestCommandMixin.RESPONSE_POOLS
-        while not pools.empty():
-            pool = pools.get()
+        while True:
+            try:
+                pool = pools.popleft()
+            except IndexError:
+                break
             if not pool.is_done:
                 pool.is_done = True
                 requests = pool.get_pending_requests()
@@ -544,8 +642,9 @@ class RequesterReorderResponseTabsCommand(RequestsMixin, RequestCommandMixin, su
         views = []
         # add `ordering` property to cached response views, indicating at which ordering they appear in current view
         for view in response_views:
-            method = view.settings().get('requester.request_method', None)
-            url = view.settings().get('requester.request_url', None)
+            settings = view.settings()
+            method = settings.get('requester.request_method', None)
+            url = settings.get('requester.request_url', None)
             if not method or not url:
                 views.append(View(view, maxsize))
                 continue
@@ -643,10 +742,11 @@ class RequesterSaveRequestCommand(sublime_plugin.WindowCommand):
 def set_save_info_on_view(view, request):
     """Set file name and request string on view.
     """
-    file = view.settings().get('requester.file', None)
+    settings = view.settings()
+    file = settings.get('requester.file', None)
     if request.startswith('requests.'):
         request = request[len('requests.'):]
-    view.settings().set('requester.binding_info', (file, request))
+    settings.set('requester.binding_info', (file, request))
 
 
 def set_request_on_view(view, response):
@@ -654,6 +754,10 @@ def set_request_on_view(view, response):
     jumping to matching response tabs after requests return.
     """
     req, res, err = response
-    view.settings().set('requester.request_method', res.request.method)
-    view.settings().set('requester.request_url', res.url.split('?')[0])
-    view.settings().set('requester.tabname', req.skwargs.get('tabname'))
+    url = res.url.split('?')[0]
+    settings = view.settings()
+    settings.set('requester.request_method', res.request.method)
+    settings.set('requester.request_url', url)
+    settings.set('requester.tabname', req.skwargs.get('tabname'))
+    index_response_view(view, res.request.method, url, req.skwargs.get('tabname'))
+    last_activity_shown.pop(view.id(), None)  # response content replaced activity, next tick must repaint
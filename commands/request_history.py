@@ -35,10 +35,11 @@ def populate_staging_view(view, index, total,
     """Populate staging view with historical request string/metadata.
     """
     from .request import response_tab_bindings, set_save_info_on_view
-    view.settings().set('requester.response_view', True)
-    view.settings().set('requester.history_view', True)
-    view.settings().set('requester.file', file)
-    view.settings().set('requester.env_string', env_string)
+    settings = view.settings()
+    settings.set('requester.response_view', True)
+    settings.set('requester.history_view', True)
+    settings.set('requester.file', file)
+    settings.set('requester.env_string', env_string)
     set_save_info_on_view(view, original_request or request)
 
     config = sublime.load_settings('Requester.sublime-settings')
@@ -307,6 +308,6 @@ def write_json_file(data, path):
     path_temp = path + '.tmp'
     path_backup = path + '.bkp'
     with open(path_temp, 'w') as f:
-        f.write(json.dumps(data))  # write to temp file to ensure no data loss if exception raised here
+        json.dump(data, f)  # write to temp file to ensure no data loss if exception raised here
     os.rename(path, path_backup)  # create backup file in case rename is unsuccessful
     os.rename(path_temp, path)
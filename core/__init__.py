@@ -2,19 +2,28 @@ import sublime
 
 import os
 import sys
-import imp
 import re
 import json
-from collections import OrderedDict
+import types
+from collections import OrderedDict, deque
+from itertools import islice
 from threading import Thread, Lock
 from time import time
-from queue import Queue
 
 from ..add_path import add_path
 from .helpers import is_auxiliary_view
 from .responses import ResponseThreadPool, prepend_library
 
 
+ENV_FILE_RE = re.compile(r'^[ \t]*env_file[ \t]*=.*', re.MULTILINE)
+
+history_cache = {}  # history_path -> ((st_mtime_ns, st_size), parsed history dict)
+
+env_code_cache = {}  # env string -> compiled code object, so repeated requests skip recompiling the env
+
+activity_indicator_cache = {}  # spaces -> tuple of precomputed indicator strings
+
+
 class RequestCommandMixin:
     """This mixin is the motor for parsing an env, executing requests in parallel
     in the context of this env, invoking activity indicator methods, and invoking
@@ -27,7 +36,7 @@ class RequestCommandMixin:
     REFRESH_MS = 100  # period of checks on async operations, e.g. requests
     ACTIVITY_SPACES = 9  # number of spaces in activity indicator
     MAX_WORKERS = 10  # default request concurrency
-    RESPONSE_POOLS = Queue()
+    RESPONSE_POOLS = deque()  # `append`/`popleft` are atomic under CPython
     MAX_NUM_RESPONSE_POOLS = 10  # up to N response pools can be stored
     LOCK = Lock()  # this lock is shared among all instances
 
@@ -109,16 +118,18 @@ class RequestCommandMixin:
         if packages_path and packages_path not in sys.path:  # makes it possible to import any Python package in env
             sys.path.append(packages_path)
 
+        settings = self.view.settings()
         env_block, env_block_line_number, env_file, env_file_line_number = [None] * 4
         parsed = False
 
         if not is_auxiliary_view(self.view):  # (1) try to get env from current view
-            self.view.settings().set('requester.file', self.view.file_name())
+            file = self.view.file_name()
+            settings.set('requester.file', file)
             text = self.view.substr(sublime.Region(0, self.view.size()))
             env_block, env_block_line_number, env_file, env_file_line_number = self.parse_env(text)
             parsed = True
         else:
-            file = self.view.settings().get('requester.file', None)
+            file = settings.get('requester.file', None)
             if file:  # (2) try to get env from saved requester file if (1) not possible
                 try:
                     with open(file, 'r', encoding='utf-8') as f:
@@ -130,14 +141,16 @@ class RequestCommandMixin:
                     parsed = True
 
         if not parsed:  # (3) try to get env from saved env string if (1) and (2) not possible
-            env_string = self.view.settings().get('requester.env_string', None)
+            env_string = settings.get('requester.env_string', None)
             return self.get_env_dict_from_string(env_string), env_string
 
+        # this read can't be overlapped with the one above: the env file's path is
+        # only known after the text read there has been parsed; the whole of
+        # `get_env` already runs off the UI thread, see `run`
         if env_file:
             if not os.path.isabs(env_file):
-                file_path = self.view.settings().get('requester.file')
-                if file_path:
-                    env_file = os.path.join(os.path.dirname(file_path), env_file)
+                if file:
+                    env_file = os.path.join(os.path.dirname(file), env_file)
             try:
                 with open(env_file, 'r') as f:
                     env_strings.append(f.read())
@@ -152,7 +165,7 @@ class RequestCommandMixin:
                 non_empty_env_strings.reverse()
 
         env_string = '\n\n'.join(non_empty_env_strings)
-        self.view.settings().set('requester.env_string', env_string)
+        settings.set('requester.env_string', env_string)
         return self.get_env_dict_from_string(env_string), env_string
 
     def _get_env(self):
@@ -163,8 +176,9 @@ class RequestCommandMixin:
     def set_env_on_view(self, view):
         """Convenience method that copies env settings from this view to `view`.
         """
+        settings, other_settings = self.view.settings(), view.settings()
         for setting in ['requester.file', 'requester.env_string']:
-            view.settings().set(setting, self.view.settings().get(setting, None))
+            other_settings.set(setting, settings.get(setting, None))
 
     def make_requests(self, requests, env=None):
         """Make requests concurrently using a `ThreadPool`, which itself runs on
@@ -172,9 +186,9 @@ class RequestCommandMixin:
         """
         pools = self.RESPONSE_POOLS
         pool = ResponseThreadPool(requests, env, self.MAX_WORKERS, self.view)  # pass along env vars to thread pool
-        pools.put(pool)
-        while pools.qsize() > self.MAX_NUM_RESPONSE_POOLS:
-            old_pool = pools.get()
+        pools.append(pool)
+        while len(pools) > self.MAX_NUM_RESPONSE_POOLS:
+            old_pool = pools.popleft()
             old_pool.is_done = True  # don't display responses for a pool which has already been removed
         sublime.set_timeout_async(pool.run, 0)  # run on an alternate thread
         sublime.set_timeout(lambda: self.gather_responses(pool), 15)
@@ -210,7 +224,8 @@ class RequestCommandMixin:
             responses.sort(key=lambda response: response.req.ordering)
             self.handle_responses(responses)
             self.handle_errors(responses)
-            self.persist_requests(responses)
+            # history file I/O happens on an alternate thread, so it can't block the UI
+            sublime.set_timeout_async(lambda: self.persist_requests(responses), 0)
             self.view.set_status('requester.activity', '')
             return
 
@@ -250,38 +265,40 @@ class RequestCommandMixin:
         Also returns line numbers for start of env block and env file.
         """
         delimeter = '###env'
-        in_block = False
-
-        env_lines = []
-        env_block_line_number = None
-        env_file_line_number = None
-
-        for i, line in enumerate(text.splitlines()):
-            if in_block:
-                if line == delimeter:
-                    in_block = False
-                    break
-                env_lines.append(line)
-            else:
-                if line == delimeter:
-                    env_block_line_number = i
-                    in_block = True
-
-        scope = {}
-        p = re.compile(r'\s*env_file\s*=.*')
-        for i, line in enumerate(text.splitlines()):
-            if p.match(line):  # matches only at beginning of string
-                try:
-                    exec(line, scope)  # add `env_file` to `scope` dict
-                    env_file_line_number = i
-                except Exception as e:
-                    print(e)
-                break  # stop looking after first match
 
-        env_file = scope.get('env_file')
-        if not len(env_lines) or in_block:  # env block must be closed to take effect
-            return None, None, env_file, env_file_line_number
-        return '\n'.join(env_lines), env_block_line_number, env_file, env_file_line_number
+        def find_delimeter(start):
+            """Find index of next `delimeter` that makes up an entire line.
+            """
+            index = text.find(delimeter, start)
+            while index != -1:
+                if index == 0 or text[index-1] == '\n':
+                    end = index + len(delimeter)
+                    if end == len(text) or text[end] == '\n':
+                        return index
+                index = text.find(delimeter, index+1)
+            return -1
+
+        env_block, env_block_line_number = None, None
+        block_start = find_delimeter(0)
+        if block_start != -1:
+            content_start = block_start + len(delimeter) + 1
+            block_end = find_delimeter(content_start)
+            if block_end > content_start:  # env block must be closed to take effect
+                env_block = text[content_start:block_end-1]
+                env_block_line_number = text.count('\n', 0, block_start)
+
+        env_file, env_file_line_number = None, None
+        match = ENV_FILE_RE.search(text)
+        if match:
+            scope = {}
+            try:
+                exec(match.group(), scope)  # add `env_file` to `scope` dict
+                env_file_line_number = text.count('\n', 0, match.start())
+            except Exception as e:
+                print(e)
+            env_file = scope.get('env_file')
+
+        return env_block, env_block_line_number, env_file, env_file_line_number
 
     @staticmethod
     def get_env_dict_from_string(s):
@@ -297,10 +314,15 @@ class RequestCommandMixin:
         if not s:
             return {}
 
-        env = imp.new_module('requester.env')
+        env = types.ModuleType('requester.env')
         try:
+            code = env_code_cache.get(s)
+            if code is None:
+                if len(env_code_cache) >= 32:  # env strings can be big, don't hold on to too many
+                    env_code_cache.clear()
+                code = env_code_cache[s] = compile(s, '<requester-env>', 'exec')
             with add_path(__file__, '..', '..', 'deps'):
-                exec(s, env.__dict__)
+                exec(code, env.__dict__)
         except Exception as e:
             sublime.error_message(
                 'EnvBlock Error:\n{}\n\nOpen the console to see the full environment string'.format(e))
@@ -311,15 +333,22 @@ class RequestCommandMixin:
 
     @staticmethod
     def get_activity_indicator(count, spaces):
-        """Return activity indicator string.
+        """Return activity indicator string. Indicator strings are precomputed,
+        because this is invoked on every refresh tick while requests are pending.
         """
+        try:
+            table = activity_indicator_cache[spaces]
+        except KeyError:
+            table = tuple(
+                '[{}={}]'.format(' ' * before, ' ' * (spaces-before)) for before in range(spaces+1)
+            )
+            activity_indicator_cache[spaces] = table
         cycle = count // spaces
         if cycle % 2 == 0:
             before = count % spaces
         else:
             before = spaces - (count % spaces)
-        after = spaces - before
-        return '[{}={}]'.format(' ' * before, ' ' * after)
+        return table[before]
 
 
 def persist_requests(self, responses, history_path=None):
@@ -329,28 +358,49 @@ def persist_requests(self, responses, history_path=None):
 
     Requests in history are keyed for uniqueness on request string + file.
     """
+    responses = [response for response in responses if response.res is not None]
+    if not responses:  # error-only batches shouldn't touch the history file at all
+        return
+
     history_file = self.config.get('history_file', None)
     if not history_file:
         return
     if not history_path:
         history_path = os.path.join(sublime.packages_path(), 'User', history_file)
 
+    rh = None
     try:
-        with open(history_path, 'r') as f:
-            text = f.read() or '{}'
+        stat = os.stat(history_path)
     except FileNotFoundError:
         open(history_path, 'w').close()  # create history file if it doesn't exist
-        text = '{}'
+        rh = OrderedDict()
     except Exception as e:
         sublime.error_message('HistoryFile Error:\n{}'.format(e))
         return
-    rh = json.loads(text, object_pairs_hook=OrderedDict)
+    else:
+        # reuse parsed history unless file was modified since it was last written
+        # here, e.g. by the commands that delete requests or move requester files
+        cached = history_cache.get(history_path)
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            rh = cached[1]
+
+    if rh is None:
+        try:
+            with open(history_path, 'r') as f:
+                text = f.read() or '{}'
+        except Exception as e:
+            sublime.error_message('HistoryFile Error:\n{}'.format(e))
+            return
+        rh = json.loads(text, object_pairs_hook=OrderedDict)
+
+    settings = self.view.settings()
+    file = settings.get('requester.file', None)
+    env_string = settings.get('requester.env_string', None)
+    _, original_request_setting = settings.get('requester.binding_info', [None, None])
 
     meta = None
     for response in responses:  # insert new requests
         req, res, err = response
-        if res is None:
-            continue
 
         if 'streamed' in req.skwargs:
             meta = 'streamed: {}'.format(req.skwargs['streamed'])
@@ -361,17 +411,16 @@ def persist_requests(self, responses, history_path=None):
 
         tabname = req.skwargs.get('tabname')
         method, url = res.request.method, res.url
-        file = self.view.settings().get('requester.file', None)
-        _, original_request = self.view.settings().get('requester.binding_info', [None, None])
+        original_request = original_request_setting
         if original_request is not None and prepend_library(original_request) == req.request:
             original_request = None  # don't waste space in hist file if these requests are identical
 
         key = '{};;{}'.format(req.request, file) if file else req.request
         if key in rh:
-            rh.pop(key, None)  # remove duplicate requests
+            rh.move_to_end(key)  # move duplicate requests to end, `move_to_end` is O(1)
         rh[key] = {
             'ts': int(time()),
-            'env_string': self.view.settings().get('requester.env_string', None),
+            'env_string': env_string,
             'file': file,
             'method': method,
             'meta': meta,
@@ -386,19 +435,14 @@ def persist_requests(self, responses, history_path=None):
     history_max_entries = self.config.get('history_max_entries', 250)
     to_delete = len(rh) - history_max_entries
     if to_delete > 0:
-        keys = []
-        iter_ = iter(rh.keys())
-        for _ in range(to_delete):
-            try:
-                keys.append(next(iter_))
-            except StopIteration:
-                break
-        for key in keys:
-            try:
-                del rh[key]
-            except KeyError:
-                pass
+        for key in list(islice(rh, to_delete)):
+            del rh[key]
     write_json_file(rh, history_path)
+    try:
+        stat = os.stat(history_path)
+        history_cache[history_path] = ((stat.st_mtime_ns, stat.st_size), rh)
+    except Exception:
+        history_cache.pop(history_path, None)
 
 
 def write_json_file(data, path):
@@ -409,6 +453,6 @@ def write_json_file(data, path):
     path_temp = path + '.tmp'
     path_backup = path + '.bkp'
     with open(path_temp, 'w') as f:
-        f.write(json.dumps(data))  # write to temp file to ensure no data loss if exception raised here
+        json.dump(data, f)  # write to temp file to ensure no data loss if exception raised here
     os.rename(path, path_backup)  # create backup file in case rename is unsuccessful
     os.rename(path_temp, path)
@@ -70,8 +70,9 @@ def is_auxiliary_view(view):
     """Was view opened by a Requester command? This is useful, e.g., to
     avoid resetting `env_file` and `env_string` on these views.
     """
-    if view.settings().get('requester.response_view', False):
+    settings = view.settings()
+    if settings.get('requester.response_view', False):
         return True
-    if view.settings().get('requester.test_view', False):
+    if settings.get('requester.test_view', False):
         return True
     return False
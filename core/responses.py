@@ -2,6 +2,7 @@ import sublime
 
 import re
 from urllib import parse
+from threading import local
 from concurrent import futures
 from collections import namedtuple, deque
 
@@ -14,15 +15,9 @@ from .helpers import truncate, prepend_scheme, is_instance, is_auxiliary_view
 Request_ = namedtuple('Request', 'request, method, url, args, kwargs, ordering, session, skwargs, error')
 Response = namedtuple('Response', 'req, res, err')
 
-methods = {
-    'GET': requests.get,
-    'OPTIONS': requests.options,
-    'HEAD': requests.head,
-    'POST': requests.post,
-    'PUT': requests.put,
-    'PATCH': requests.patch,
-    'DELETE': requests.delete,
-}
+# matches calls whose only arg is a literal URL string, e.g. "requests.get('http://a.com')"
+LITERAL_URL_CALL = re.compile(
+    r"requests\.(get|options|head|post|put|patch|delete)\(\s*(url\s*=\s*)?(['\"])([^'\"\\\n\r]*)\3\s*\)\Z")
 
 
 class Request(Request_):
@@ -56,6 +51,10 @@ class ResponseThreadPool:
         "chaining" of requests. If two requests are run serially, the second
         request can reference the response returned by the previous request.
         """
+        # requests are parsed and evaluated exactly once, into `Request` namedtuples
+        # whose `method` and `url` the activity indicator reads directly on each
+        # refresh tick; parsing can't happen any earlier than this, because args can
+        # reference responses to previously executed requests ("chaining")
         if isinstance(request, Request):  # no need to prepare request
             req = request._replace(ordering=ordering)
         else:
@@ -78,7 +77,7 @@ class ResponseThreadPool:
                 else:
                     err = 'Session Error: there is no session `{}` defined in your environment'.format(req.session)
             else:
-                res = methods.get(req.method)(*req.args, **req.kwargs)
+                res = self.get_worker_session().request(req.method, *req.args, **req.kwargs)
         except requests.Timeout:
             err = 'Timeout Error: the request timed out'
         except requests.ConnectionError as e:
@@ -123,6 +122,22 @@ class ResponseThreadPool:
         self.env = env
         self.max_workers = max_workers
         self.view = view
+        self._local = local()
+        self._sessions = []
+
+    def get_worker_session(self):
+        """Returns a `requests.Session` scoped to the calling worker thread, so
+        that requests executed on the same thread reuse keep-alive connections
+        instead of paying a TCP/TLS handshake each. Cookies are cleared before
+        each request to preserve the isolation of `requests.get` and friends.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            self._sessions.append(session)  # `list.append` is atomic under CPython
+        session.cookies.clear()
+        return session
 
     def get_pending_requests(self):
         """Getter for `self.pending_requests`. This is a `set` that's shared
@@ -152,6 +167,8 @@ class ResponseThreadPool:
                 except KeyError:
                     print('{} was not in pending requests, this is weird...'.format(result.req))
                 self.responses.append(result)
+        for session in self._sessions:
+            session.close()
         self.is_done = True
 
 
@@ -176,17 +193,24 @@ def prepare_request(request, env, ordering, view=None):
     index = req.index('(')
     method = req[:index].split('.')[1].strip().upper()
 
-    env['__parse_args__'] = parse_args
-    try:
-        args, kwargs = eval('__parse_args__{}'.format(req[index:]), env)
-    except Exception as e:
-        msg = 'PrepareRequest Error: {}\n\n{}'.format(e, truncate(req, 150))
-        if type(e) is NameError and view and is_auxiliary_view(view):
-            msg += '\n\nYou may have since deleted env var(s) from your requester file'
-        sublime.error_message(msg)
-        return Request(req, method, None, [], {}, ordering, session, {}, error=str(e))
+    match = None if session else LITERAL_URL_CALL.match(req)
+    if match:  # fast path for the most common request shape, skips compiling and evaling args
+        if match.group(2):  # normalize exactly as eval path would
+            args, kwargs = [], {'url': match.group(4)}
+        else:
+            args, kwargs = [match.group(4)], {}
     else:
-        args = list(args)
+        env['__parse_args__'] = parse_args
+        try:
+            args, kwargs = eval('__parse_args__{}'.format(req[index:]), env)
+        except Exception as e:
+            msg = 'PrepareRequest Error: {}\n\n{}'.format(e, truncate(req, 150))
+            if type(e) is NameError and view and is_auxiliary_view(view):
+                msg += '\n\nYou may have since deleted env var(s) from your requester file'
+            sublime.error_message(msg)
+            return Request(req, method, None, [], {}, ordering, session, {}, error=str(e))
+        else:
+            args = list(args)
 
     url_from_kwargs = True
     url = kwargs.get('url', None)
@@ -235,6 +235,26 @@ class TestCore(unittest.TestCase):
                 self.assertEqual(len(rh), 2)
                 self.assertEqual(list(reversed(requests[:2])), list(rh.keys()))
 
+            # persisting to the same path again hits the mtime/size-keyed cache,
+            # which must write the same entries as a fresh parse of the file
+            persist_requests(c, c._responses, path)
+            with open(path, 'r') as f:
+                rh = json.loads(f.read() or '{}', object_pairs_hook=OrderedDict)
+                self.assertEqual(len(rh), 2)
+                self.assertEqual(list(reversed(requests[:2])), list(rh.keys()))
+
+            # modifying the file externally must invalidate the cache, else this
+            # entry would be silently dropped by the next write
+            external_key = "requests.get('127.0.0.1:8000/external')"
+            rh[external_key] = dict(rh[requests[0]])
+            with open(path, 'w') as f:
+                f.write(json.dumps(rh))
+            persist_requests(c, c._responses, path)
+            with open(path, 'r') as f:
+                rh = json.loads(f.read() or '{}', object_pairs_hook=OrderedDict)
+                self.assertEqual(len(rh), 3)
+                self.assertEqual([external_key] + list(reversed(requests[:2])), list(rh.keys()))
+
 
 class TestHelpers(unittest.TestCase):
     def setUp(self):
@@ -323,6 +343,35 @@ class TestResponses(unittest.TestCase):
         self.assertEqual(req.kwargs['timeout'], 15)
         self.assertEqual(req.kwargs.get('auth'), None)
 
+    def test_prepare_request_literal_url_fast_path(self):
+        # passing `timeout=15` explicitly, which equals the default, forces the eval
+        # path without changing the resulting `Request`, so fast path and eval path
+        # results can be compared directly
+        fast = responses.prepare_request("get('a.com')", {}, 0)
+        slow = responses.prepare_request("get('a.com', timeout=15)", {}, 0)
+        self.assertEqual(fast.url, 'http://a.com')
+        self.assertEqual((fast.method, fast.url, fast.args, fast.kwargs),
+                         (slow.method, slow.url, slow.args, slow.kwargs))
+        fast = responses.prepare_request("get(url='a.com')", {}, 0)
+        slow = responses.prepare_request("get(url='a.com', timeout=15)", {}, 0)
+        self.assertEqual(fast.args, [])
+        self.assertEqual(fast.kwargs['url'], 'http://a.com')
+        self.assertEqual((fast.method, fast.url, fast.args, fast.kwargs),
+                         (slow.method, slow.url, slow.args, slow.kwargs))
+
+        # these must fall through to the eval path
+        req = responses.prepare_request("get(\"a.com/it's\")", {}, 0)
+        self.assertEqual(req.url, "http://a.com/it's")
+        req = responses.prepare_request("get('a.com\\\\b')", {}, 0)
+        self.assertEqual(req.url, 'http://a.com\\b')
+        req = responses.prepare_request("get('a.com', headers={'k': 'v'})", {}, 0)
+        self.assertEqual(req.url, 'http://a.com')
+        self.assertEqual(req.kwargs['headers'], {'k': 'v'})
+        # a line break inside the URL literal is invalid Python, and must fall
+        # through to eval so it surfaces a syntax error instead of being requested
+        req = responses.prepare_request("get('a\n.com')", {}, 0)
+        self.assertTrue(req.error is not None)
+
     def test_prepend_library(self):
         request = responses.prepend_library("get('a.b') ")
         self.assertEqual(request, "requests.get('a.b')")